@@ -11,9 +11,12 @@ class TitleFilter(rest_framework.FilterSet):
         field_name='category__slug',
         lookup_expr='contains'
     )
+    # JOIN через GenreTitle дает строку на каждый подходящий жанр,
+    # distinct оставляет каждое произведение один раз
     genre = rest_framework.CharFilter(
         field_name='genre__slug',
-        lookup_expr='contains'
+        lookup_expr='contains',
+        distinct=True
     )
 
     class Meta:
@@ -0,0 +1,97 @@
+import hashlib
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.response import Response
+
+from api_yamdb.settings import LIST_CACHE_TIMEOUT
+
+
+def get_list_cache_version(basename):
+    """
+    Возвращает текущую версию кэша списков для ресурса (basename роутера).
+    """
+    return cache.get_or_set(
+        f'list_version:{basename}', lambda: uuid4().hex, None
+    )
+
+
+def invalidate_list_cache(*basenames):
+    """
+    Сбрасывает кэш списков для перечисленных ресурсов.
+
+    Ключи закэшированных ответов содержат версию, поэтому достаточно
+    сменить версию: старые записи больше не читаются и истекают сами.
+    """
+    for basename in basenames:
+        cache.set(f'list_version:{basename}', uuid4().hex, None)
+
+
+def invalidate_list_cache_on_commit(*basenames):
+    """
+    Сбрасывает кэш списков после фиксации текущей транзакции.
+
+    Если сменить версию внутри транзакции, запрос списка, пришедший
+    до ее фиксации, закэширует старые данные уже под новой версией.
+    Вне транзакции сброс выполняется сразу.
+    """
+    transaction.on_commit(lambda: invalidate_list_cache(*basenames))
+
+
+class CachedListMixin:
+    """
+    Миксин для кэширования ответов list.
+
+    Данные ответа хранятся в кэше по полному URL запроса (с фильтрами,
+    поиском и курсором пагинации). URL входит в ключ в виде хэша, чтобы
+    длина и символы ключа подходили и для memcached. Кэш сбрасывается сигналами при изменении
+    связанных моделей (см. api/signals.py).
+
+    Атрибуты:
+        list_cache_timeout (int): Время жизни записи в кэше, секунды.
+    """
+    list_cache_timeout = LIST_CACHE_TIMEOUT
+
+    def list(self, request, *args, **kwargs):
+        cache_key = 'list:{}:{}:{}'.format(
+            self.basename,
+            get_list_cache_version(self.basename),
+            hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+        )
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response(data)
+        response = super().list(request, *args, **kwargs)
+        cache.set(cache_key, response.data, self.list_cache_timeout)
+        return response
+
+
+class ValuesListMixin:
+    """
+    Миксин для отдачи списка объектов через QuerySet.values().
+
+    Для плоских справочников (категории, жанры) создание экземпляров моделей
+    и проход сериализатора по полям дороже самого запроса, поэтому список
+    строится сразу из словарей, возвращаемых БД.
+    Поиск (filter_backends) и пагинация применяются как в ListModelMixin.
+
+    Атрибуты:
+        values_fields (tuple): Поля, выбираемые из БД.
+
+    Методы:
+        build_list_data(self, rows): Преобразует строки страницы в данные ответа.
+    """
+    values_fields = ()
+
+    def build_list_data(self, rows):
+        return rows
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset()).prefetch_related(
+            None
+        ).values(*self.values_fields)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.build_list_data(page))
+        return Response(self.build_list_data(list(queryset)))
@@ -0,0 +1,46 @@
+from collections import OrderedDict
+
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+
+
+class CountedCursorPagination(CursorPagination):
+    """
+    Курсорная пагинация с полем count в ответе.
+
+    Вместо OFFSET страницы выбираются условием по индексированному полю
+    (WHERE field > ? LIMIT n), поэтому стоимость запроса не растет с номером
+    страницы. Поле count сохранено, чтобы формат ответа совпадал
+    с PageNumberPagination (count, next, previous, results).
+    COUNT по всей выборке растет с размером таблицы, поэтому count
+    считается только для первой страницы (без параметра cursor),
+    на следующих страницах он равен null.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count = None
+        if self.cursor_query_param not in request.query_params:
+            self.count = queryset.count()
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('count', self.count),
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data)
+        ]))
+
+
+class IdCursorPagination(CountedCursorPagination):
+    """
+    Курсорная пагинация по первичному ключу (пользователи, произведения).
+    """
+    ordering = 'id'
+
+
+class PubDateCursorPagination(CountedCursorPagination):
+    """
+    Курсорная пагинация по дате публикации (отзывы, комментарии).
+    """
+    ordering = 'pub_date'
@@ -1,25 +1,102 @@
-import datetime as dt
+import copy
+import hashlib
 
 from django.contrib.auth.validators import UnicodeUsernameValidator
+from django.core.cache import cache
 from rest_framework import serializers
-from rest_framework.generics import get_object_or_404
-from rest_framework.validators import UniqueValidator
 from reviews.models import (Category, Comment, Genre, GenreTitle, Review,
                             Title, User)
 
+from api_yamdb.settings import SLUG_CACHE_TIMEOUT
 
-class UserSerializer(serializers.ModelSerializer):
+from .mixins import get_list_cache_version
+
+# один экземпляр валидатора (и его скомпилированное регулярное выражение)
+# на все сериализаторы пользователя
+USERNAME_VALIDATOR = UnicodeUsernameValidator()
+
+
+class CachedFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer, который строит набор полей один раз для класса.
+
+    Обычный ModelSerializer при каждом создании экземпляра заново разбирает
+    Meta.fields и поля модели. Здесь готовый набор полей сохраняется
+    для класса, а экземпляр получает его копию (поля привязываются
+    к конкретному сериализатору, поэтому общими быть не могут).
+    Подходит только для сериализаторов, набор полей которых не зависит
+    от экземпляра или контекста.
+    """
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        if cls not in self._fields_cache:
+            self._fields_cache[cls] = super().get_fields()
+        return copy.deepcopy(self._fields_cache[cls])
+
+
+class RoleField(serializers.ChoiceField):
+    """
+    Поле роли пользователя.
+
+    В API роль передается строкой ('user', 'moderator', 'admin'),
+    а в модели хранится числом из User.Role.
+    """
+    def __init__(self, **kwargs):
+        kwargs['choices'] = User.Role.labels
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        return User.Role[super().to_internal_value(data).upper()]
+
+    def to_representation(self, value):
+        return User.Role(value).label
+
+
+class CachedSlugRelatedField(serializers.SlugRelatedField):
+    """
+    SlugRelatedField, который запоминает найденные по slug объекты в кэше.
+
+    Ключ кэша содержит версию кэша списков ресурса (cache_basename), поэтому
+    при изменении или удалении объекта сигналы из api/signals.py сбрасывают
+    и эти записи. Несуществующие slug не кэшируются. Значение от клиента
+    входит в ключ в виде хэша: ключ остается допустимым для memcached
+    при любой длине и любых символах.
+
+    Атрибуты:
+        cache_basename (str): Ресурс, версией кэша которого помечаются ключи.
+    """
+    def __init__(self, cache_basename, **kwargs):
+        self.cache_basename = cache_basename
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        cache_key = 'slug:{}:{}:{}'.format(
+            self.cache_basename,
+            get_list_cache_version(self.cache_basename),
+            hashlib.md5(str(data).encode()).hexdigest()
+        )
+        obj = cache.get(cache_key)
+        if obj is None:
+            obj = super().to_internal_value(data)
+            cache.set(cache_key, obj, SLUG_CACHE_TIMEOUT)
+        return obj
+
+
+class UserSerializer(CachedFieldsModelSerializer):
     """
     Сериализатор для модели User (полная информация).
 
     Используется для представления полной информации о пользователе, включая роль и bio.
-    Включает валидаторы для username и email, чтобы обеспечить уникальность и соответствие требованиям.
+    Проверяет формат username; уникальность username и email обеспечивается
+    ограничениями БД (см. save_user во views).
 
     Атрибуты:
         username (CharField):  Имя пользователя. Обязательное поле, должно быть уникальным.
-                              Проверяется на соответствие UnicodeUsernameValidator и UniqueValidator.
+                              Проверяется на соответствие UnicodeUsernameValidator.
         email (EmailField):   Адрес электронной почты. Обязательное поле, должно быть уникальным.
-                              Проверяется на соответствие UniqueValidator.
+        role (RoleField):     Роль пользователя. Необязательное поле.
 
     Meta:
         model (User):  Модель, для которой предназначен сериализатор (User).
@@ -27,8 +104,7 @@ class UserSerializer(serializers.ModelSerializer):
     """
     username = serializers.CharField(
         validators=[
-            UnicodeUsernameValidator(),
-            UniqueValidator(queryset=User.objects.all())
+            USERNAME_VALIDATOR,
         ],
         max_length=150,
         required=True,
@@ -36,10 +112,8 @@ class UserSerializer(serializers.ModelSerializer):
     email = serializers.EmailField(
         max_length=254,
         required=True,
-        validators=[
-            UniqueValidator(queryset=User.objects.all())
-        ]
     )
+    role = RoleField(required=False)
 
     class Meta:
         model = User
@@ -47,17 +121,17 @@ class UserSerializer(serializers.ModelSerializer):
                   'first_name', 'last_name')
 
 
-class RegisterDataSerializer(serializers.ModelSerializer):
+class RegisterDataSerializer(CachedFieldsModelSerializer):
     '''
-    Включает валидаторы для username и email, чтобы обеспечить уникальность и соответствие требованиям.
+    Проверяет только формат username и email: уникальность обеспечивается
+    ограничениями БД при создании пользователя во view register.
     Содержит кастомный валидатор для username, чтобы исключить использование "me".
 
     Атрибуты:
-        username (CharField):  Имя пользователя. Обязательное поле, должно быть уникальным.
-                              Проверяется на соответствие UnicodeUsernameValidator и UniqueValidator.
+        username (CharField):  Имя пользователя. Обязательное поле.
+                              Проверяется на соответствие UnicodeUsernameValidator.
                               Проходит кастомную валидацию для исключения "me".
-        email (EmailField):   Адрес электронной почты. Обязательное поле, должно быть уникальным.
-                              Проверяется на соответствие UniqueValidator.
+        email (EmailField):   Адрес электронной почты. Обязательное поле.
 
     Методы:
         validate_username(self, value): Кастомный валидатор для username.
@@ -70,16 +144,12 @@ class RegisterDataSerializer(serializers.ModelSerializer):
         max_length=150,
         required=True,
         validators=[
-            UnicodeUsernameValidator(),
-            UniqueValidator(queryset=User.objects.all())
+            USERNAME_VALIDATOR,
         ]
     )
     email = serializers.EmailField(
         max_length=254,
         required=True,
-        validators=[
-            UniqueValidator(queryset=User.objects.all())
-        ]
     )
 
     def validate_username(self, value):
@@ -109,17 +179,19 @@ class TokenSerializer(serializers.Serializer):
     confirmation_code = serializers.CharField()
 
 
-class UserEditSerializer(serializers.ModelSerializer):
+class UserEditSerializer(CachedFieldsModelSerializer):
     """
     Сериализатор для редактирования информации о пользователе (личный кабинет).
 
     Используется для редактирования профиля пользователя.
     Роль пользователя (role) не может быть изменена через этот сериализатор (read_only_fields).
-    Включает валидаторы для username, чтобы обеспечить уникальность и соответствие требованиям.
+    Проверяет формат username; уникальность обеспечивается ограничениями БД.
 
     Атрибуты:
         username (CharField):  Имя пользователя. Обязательное поле, должно быть уникальным.
-                              Проверяется на соответствие UnicodeUsernameValidator и UniqueValidator.
+                              Проверяется на соответствие UnicodeUsernameValidator.
+        email (EmailField):   Адрес электронной почты. Обязательное поле, должно быть уникальным.
+        role (RoleField):     Роль пользователя. Только для чтения.
 
     Meta:
         model (User):  Модель, для которой предназначен сериализатор (User).
@@ -130,10 +202,14 @@ class UserEditSerializer(serializers.ModelSerializer):
         max_length=150,
         required=True,
         validators=[
-            UnicodeUsernameValidator(),
-            UniqueValidator(queryset=User.objects.all())
+            USERNAME_VALIDATOR,
         ]
     )
+    email = serializers.EmailField(
+        max_length=254,
+        required=True,
+    )
+    role = RoleField(read_only=True)
 
     class Meta:
         fields = ('username', 'email', 'first_name',
@@ -142,7 +218,7 @@ class UserEditSerializer(serializers.ModelSerializer):
         read_only_fields = ('role',)
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(CachedFieldsModelSerializer):
     """
     Сериализатор для модели Category.
 
@@ -176,7 +252,7 @@ class GenreTitleSerializer(serializers.ModelSerializer):
         model = GenreTitle
 
 
-class GenreSerializer(serializers.ModelSerializer):
+class GenreSerializer(CachedFieldsModelSerializer):
     """
     Сериализатор для модели Genre.
 
@@ -193,58 +269,47 @@ class GenreSerializer(serializers.ModelSerializer):
         model = Genre
 
 
-class TitlesSerializer(serializers.ModelSerializer):
+class TitlesSerializer(CachedFieldsModelSerializer):
     """
     Сериализатор для модели Title.
 
     Используется для представления информации о произведении.
     Включает все поля модели Title.
     Использует SlugRelatedField для представления category и genre.
-    Содержит валидатор для года выпуска произведения (year).
+    Год выпуска (year) проверяется валидатором модели reviews.validators.validate_year,
+    который ModelSerializer переносит на поле автоматически.
 
     Атрибуты:
-        category (SlugRelatedField): Категория произведения.  Представляется с помощью slug.
-        genre (SlugRelatedField): Жанры произведения.  Представляются с помощью slug. Может быть несколько жанров.
-
-    Методы:
-        validate_year(self, value): Валидатор для года выпуска произведения.
+        category (CachedSlugRelatedField): Категория произведения.  Представляется с помощью slug.
+        genre (CachedSlugRelatedField): Жанры произведения.  Представляются с помощью slug. Может быть несколько жанров.
+                                        Найденные по slug категории и жанры берутся из кэша.
 
     Meta:
         model (Title):  Модель, для которой предназначен сериализатор (Title).
-        fields (str):  Все поля модели ("__all__").
+        exclude (tuple):  Все поля модели, кроме вычисляемых (rating, reviews_count).
     """
-    category = serializers.SlugRelatedField(
+    category = CachedSlugRelatedField(
+        cache_basename='categories',
         queryset=Category.objects.all(),
         slug_field='slug',)
-    genre = serializers.SlugRelatedField(
+    genre = CachedSlugRelatedField(
+        cache_basename='genres',
         queryset=Genre.objects.all(),
         slug_field='slug',
         many=True)
 
     class Meta:
-        fields = ('__all__')
+        exclude = ('rating', 'reviews_count')
         model = Title
 
-    def validate_year(self, value):
-        """
-        Валидатор для года выпуска произведения.
-        Год выпуска не может быть больше текущего года.
-        """
-
-        year = dt.date.today().year
-        if year < value:
-            raise serializers.ValidationError(
-                'Проверьте год выхода произведения.'
-            )
-        return value
-
 
-class ReviewSerializer(serializers.ModelSerializer):
+class ReviewSerializer(CachedFieldsModelSerializer):
     """
     Сериализатор для модели Review (отзыв).
 
     Используется для создания, чтения и обновления отзывов.
-    Включает валидацию оценки (score) и проверку на существование отзыва от текущего пользователя на данное произведение.
+    Включает валидацию оценки (score). Повторный отзыв пользователя на то же произведение
+    отсекается ограничением unique_review в БД (см. ReviewViewSet.perform_create).
 
     Атрибуты:
         title (SlugRelatedField):  Произведение, к которому относится отзыв.
@@ -258,8 +323,6 @@ class ReviewSerializer(serializers.ModelSerializer):
     Методы:
         validate_score(self, value):  Валидатор для оценки.
                                       Оценка должна быть целым числом от 1 до 10.
-        validate(self, data):        Валидатор для проверки существования отзыва от текущего пользователя на данное произведение.
-                                      Если отзыв уже существует, выбрасывает исключение ValidationError.
 
     Meta:
         model (Review): Модель, для которой предназначен сериализатор (Review).
@@ -285,25 +348,12 @@ class ReviewSerializer(serializers.ModelSerializer):
             )
         return value
 
-    def validate(self, data):
-        """
-        Валидатор для проверки, что пользователь еще не оставлял отзыв на это произведение.
-        """
-        author = self.context['request'].user
-        title_id = self.context['view'].kwargs.get('title_id')
-        title = get_object_or_404(Title, id=title_id)
-        if self.context['request'].method == 'POST':
-            if Review.objects.filter(author=author, title=title).exists():
-                raise serializers.ValidationError(
-                    'На произведение можно оставить только один отзыв.')
-        return data
-
     class Meta:
         model = Review
         fields = '__all__'
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(CachedFieldsModelSerializer):
     """
     Сериализатор для модели Comment (комментарий).
 
@@ -335,7 +385,7 @@ class CommentSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class ReadOnlyTitleSerializer(serializers.ModelSerializer):
+class ReadOnlyTitleSerializer(CachedFieldsModelSerializer):
     """
     Сериализатор для модели Title (произведение) для операций только чтения.
 
@@ -349,7 +399,7 @@ class ReadOnlyTitleSerializer(serializers.ModelSerializer):
 
     Meta:
         model (Title): Модель, для которой предназначен сериализатор (Title).
-        fields (str):   Все поля модели ("__all__").
+        exclude (tuple): Все поля модели, кроме служебного счетчика отзывов (reviews_count).
     """
     rating = serializers.IntegerField(read_only=True)
     genre = GenreSerializer(many=True, read_only=True)
@@ -357,4 +407,4 @@ class ReadOnlyTitleSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Title
-        fields = '__all__'
+        exclude = ('reviews_count',)
@@ -0,0 +1,42 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from reviews.models import Category, Genre, GenreTitle, Review, Title
+from reviews.signals import ratings_updated
+
+from .mixins import invalidate_list_cache, invalidate_list_cache_on_commit
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_lists(**kwargs):
+    invalidate_list_cache_on_commit('categories', 'titles')
+
+
+@receiver(post_save, sender=Genre)
+@receiver(post_delete, sender=Genre)
+def invalidate_genre_lists(**kwargs):
+    invalidate_list_cache_on_commit('genres', 'titles')
+
+
+@receiver(post_save, sender=Title)
+@receiver(post_delete, sender=Title)
+@receiver(post_save, sender=GenreTitle)
+@receiver(post_delete, sender=GenreTitle)
+@receiver(m2m_changed, sender=Title.genre.through)
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def invalidate_title_lists(**kwargs):
+    """
+    Список произведений включает жанры, категорию и рейтинг,
+    поэтому сбрасывается и при изменении отзывов.
+    """
+    invalidate_list_cache_on_commit('titles')
+
+
+@receiver(ratings_updated, sender=Title)
+def invalidate_title_lists_on_rating(**kwargs):
+    """
+    Рейтинг после удаления отзывов пересчитывается уже после фиксации
+    транзакции, поэтому список произведений сбрасывается еще раз.
+    """
+    invalidate_list_cache('titles')
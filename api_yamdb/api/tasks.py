@@ -0,0 +1,87 @@
+import threading
+from smtplib import SMTPServerDisconnected
+
+from celery import shared_task
+from django.conf import settings
+from django.contrib.auth.tokens import default_token_generator
+from django.core.mail import get_connection, send_mail
+from django.core.mail.backends.smtp import EmailBackend as SMTPEmailBackend
+from django.utils.module_loading import import_string
+from kombu.exceptions import OperationalError
+from reviews.models import User
+
+from api_yamdb.settings import DOMAIN_NAME
+
+
+_local = threading.local()
+
+
+def get_mail_connection():
+    """
+    Возвращает открытое соединение с почтовым сервером для текущего потока.
+
+    Соединение создается один раз и переиспользуется между письмами,
+    чтобы не проходить TCP/TLS-рукопожатие на каждую отправку.
+    Это имеет смысл только для SMTP: для остальных бэкендов (файловый,
+    консольный и т.п.) возвращается None, и каждое письмо отправляется
+    через собственное соединение.
+    """
+    if not issubclass(import_string(settings.EMAIL_BACKEND),
+                      SMTPEmailBackend):
+        return None
+    connection = getattr(_local, 'connection', None)
+    if connection is None:
+        connection = get_connection(fail_silently=False)
+        _local.connection = connection
+    connection.open()
+    return connection
+
+
+def send_confirm_mail(user):
+    """
+    Отправка кода подтверждения на email пользователя.
+
+    Если сервер закрыл переиспользуемое соединение, оно открывается
+    заново и отправка повторяется один раз.
+    """
+    confirmation_code = default_token_generator.make_token(user)
+    subject = 'YaMDb registration'
+    message = f'Ваш код подтверждения: {confirmation_code}'
+    from_email = DOMAIN_NAME
+    recipient_list = [user.email]
+    connection = get_mail_connection()
+    try:
+        return send_mail(subject, message, from_email, recipient_list,
+                         connection=connection)
+    except SMTPServerDisconnected:
+        if connection is None:
+            raise
+        connection.close()
+        connection.open()
+        return send_mail(subject, message, from_email, recipient_list,
+                         connection=connection)
+
+
+@shared_task
+def send_confirm_mail_task(user_id):
+    """
+    Фоновая отправка кода подтверждения.
+
+    Запрос регистрации только ставит задачу в очередь и не ждет
+    ответа почтового сервера.
+    """
+    user = User.objects.get(pk=user_id)
+    return send_confirm_mail(user)
+
+
+def queue_confirm_mail(user):
+    """
+    Ставит отправку кода подтверждения в очередь Celery.
+
+    Если брокер недоступен, письмо отправляется сразу в текущем процессе:
+    пользователь уже создан, и регистрация не должна падать с ошибкой 500.
+    """
+    try:
+        send_confirm_mail_task.delay(user.pk)
+    except OperationalError:
+        send_confirm_mail(user)
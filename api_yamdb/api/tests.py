@@ -0,0 +1,289 @@
+import warnings
+from unittest import mock
+
+from django.contrib.auth.tokens import default_token_generator
+from django.core import mail
+from django.core.cache import cache
+from django.core.cache.backends.base import CacheKeyWarning
+from django.db import IntegrityError, connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from reviews.models import Category, Genre, Title, User
+
+from . import tasks
+from .mixins import get_list_cache_version
+
+
+class TitleFilterTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        category = Category.objects.create(name='Фильм', slug='movie')
+        self.title = Title.objects.create(
+            name='Побег из Шоушенка', year=1994, category=category
+        )
+        self.title.genre.add(
+            Genre.objects.create(name='Драма', slug='drama'),
+            Genre.objects.create(name='Комедия', slug='comedy'),
+        )
+
+    def test_genre_filter_returns_each_title_once(self):
+        """Несколько подходящих жанров не дублируют произведение в списке."""
+        response = self.client.get('/api/v1/titles/', {'genre': 'd'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(
+            [title['id'] for title in response.data['results']],
+            [self.title.id]
+        )
+
+
+class TitleUpdateTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create(
+            username='admin', email='admin@yamdb.fake', role=User.Role.ADMIN
+        ))
+        category = Category.objects.create(name='Фильм', slug='movie')
+        self.title = Title.objects.create(
+            name='Побег из Шоушенка', year=1994, category=category
+        )
+
+    def test_patch_does_not_write_rating(self):
+        """Изменение произведения не перезаписывает рейтинг из отзывов."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(
+                f'/api/v1/titles/{self.title.id}/', {'name': 'Побег'}
+            )
+        self.assertEqual(response.status_code, 200)
+        updates = [query['sql'] for query in queries.captured_queries
+                   if query['sql'].startswith('UPDATE "reviews_title"')]
+        self.assertEqual(len(updates), 1)
+        self.assertNotIn('"rating"', updates[0])
+        self.assertNotIn('"reviews_count"', updates[0])
+
+
+class ConfirmationCodeCacheTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create(
+            username='bob', email='bob@yamdb.fake'
+        )
+        self.code = default_token_generator.make_token(self.user)
+
+    def get_token(self):
+        return self.client.post('/api/v1/auth/token/', {
+            'username': 'bob', 'confirmation_code': self.code
+        })
+
+    def test_cached_code_rejected_after_email_change(self):
+        """Смена email делает недействительной и закэшированную проверку."""
+        self.assertEqual(self.get_token().status_code, 200)
+        self.user.email = 'new@yamdb.fake'
+        self.user.save()
+        self.assertEqual(self.get_token().status_code, 400)
+
+
+class CacheKeyTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create(
+            username='admin', email='admin@yamdb.fake', role=User.Role.ADMIN
+        ))
+
+    def test_bad_slug_gives_valid_cache_key(self):
+        """Произвольный slug от клиента не ломает ключ кэша (memcached)."""
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            response = self.client.post('/api/v1/titles/', {
+                'name': 'Фильм', 'year': 2000,
+                'category': 'bad slug ' * 50, 'genre': ['bad\nslug'],
+            })
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse([warning for warning in caught
+                          if issubclass(warning.category, CacheKeyWarning)])
+
+    def test_long_query_string_gives_valid_cache_key(self):
+        """Длинная строка запроса не ломает ключ кэша списка."""
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            response = self.client.get(
+                '/api/v1/categories/', {'search': 'категория ' * 50}
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse([warning for warning in caught
+                          if issubclass(warning.category, CacheKeyWarning)])
+
+
+class CursorPaginationTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        category = Category.objects.create(name='Фильм', slug='movie')
+        Title.objects.bulk_create([
+            Title(name=f'Фильм {i}', year=2000, category=category)
+            for i in range(15)
+        ])
+
+    def test_count_only_on_first_page(self):
+        """COUNT выполняется только для первой страницы."""
+        first = self.client.get('/api/v1/titles/')
+        self.assertEqual(first.data['count'], 15)
+        with CaptureQueriesContext(connection) as queries:
+            second = self.client.get(first.data['next'])
+        self.assertIsNone(second.data['count'])
+        self.assertEqual(len(second.data['results']), 5)
+        self.assertFalse([query for query in queries.captured_queries
+                          if 'COUNT(' in query['sql']])
+
+
+class StaleSlugCacheTests(TransactionTestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create(
+            username='admin', email='admin@yamdb.fake', role=User.Role.ADMIN
+        ))
+        Category.objects.create(name='Книга', slug='book')
+        Genre.objects.create(name='Драма', slug='drama')
+
+    def post_title(self):
+        return self.client.post('/api/v1/titles/', {
+            'name': 'Фильм', 'year': 2000,
+            'category': 'book', 'genre': ['drama'],
+        })
+
+    def test_deleted_category_from_cache_gives_400(self):
+        """Категория, удаленная другим процессом, не дает ошибку 500."""
+        self.assertEqual(self.post_title().status_code, 201)
+        # удаление в другом процессе: сигналы этого процесса кэш не сбрасывают
+        with mock.patch('api.signals.invalidate_list_cache_on_commit'):
+            Category.objects.filter(slug='book').delete()
+        response = self.post_title()
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('category', response.data)
+
+    def test_recreated_category_from_cache_is_saved(self):
+        """Категория, созданная заново с тем же slug, подставляется из БД."""
+        self.assertEqual(self.post_title().status_code, 201)
+        with mock.patch('api.signals.invalidate_list_cache_on_commit'):
+            Category.objects.filter(slug='book').delete()
+            category = Category.objects.create(name='Книга', slug='book')
+        response = self.post_title()
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            Title.objects.get(pk=response.data['id']).category, category
+        )
+
+
+class ListCacheInvalidationTests(TestCase):
+
+    def test_version_changes_only_after_commit(self):
+        """Версия кэша списков меняется только после фиксации транзакции."""
+        version = get_list_cache_version('categories')
+        with self.captureOnCommitCallbacks(execute=True):
+            Category.objects.create(name='Книга', slug='book')
+            self.assertEqual(get_list_cache_version('categories'), version)
+        self.assertNotEqual(get_list_cache_version('categories'), version)
+
+
+class UserEditTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username='user', email='u@ya.ru')
+        User.objects.create(username='other', email='o@ya.ru')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_patch_email_skips_unique_select(self):
+        """Уникальность email проверяется индексом, а не SELECT-запросом."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(
+                '/api/v1/users/me/', {'email': 'new@ya.ru'}
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(any(
+            'email' in query['sql'] and query['sql'].startswith('SELECT')
+            for query in queries.captured_queries
+        ))
+
+    def test_patch_taken_email_gives_400(self):
+        response = self.client.patch(
+            '/api/v1/users/me/', {'email': 'o@ya.ru'}
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('email', response.data)
+
+
+class ReviewCreateTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username='user', email='u@ya.ru')
+        self.title = Title.objects.create(name='Фильм', year=2000)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = f'/api/v1/titles/{self.title.pk}/reviews/'
+
+    def test_second_review_gives_400(self):
+        data = {'text': 'Отзыв', 'score': 5}
+        self.client.post(self.url, data)
+        response = self.client.post(self.url, data)
+        self.assertEqual(response.status_code, 400)
+
+    def test_other_integrity_error_is_not_masked(self):
+        """Ошибка целостности без повторного отзыва не превращается в 400."""
+        with mock.patch(
+            'api.serializers.ReviewSerializer.save',
+            side_effect=IntegrityError,
+        ):
+            with self.assertRaises(IntegrityError):
+                self.client.post(self.url, {'text': 'Отзыв', 'score': 5})
+
+
+class RendererTests(TestCase):
+
+    def setUp(self):
+        Category.objects.create(name='Фильм ', slug='movie')
+        self.client = APIClient()
+
+    def test_indent_from_accept_header(self):
+        response = self.client.get(
+            '/api/v1/categories/', HTTP_ACCEPT='application/json; indent=4'
+        )
+        self.assertIn(b'\n    "count"', response.content)
+
+    def test_compact_output_escapes_line_separators(self):
+        response = self.client.get('/api/v1/categories/')
+        self.assertIn(b'\\u2028', response.content)
+        self.assertNotIn(b'\n', response.content)
+
+
+class MailConnectionTests(TestCase):
+
+    def tearDown(self):
+        tasks._local.__dict__.clear()
+
+    def test_non_smtp_backend_gets_connection_per_message(self):
+        self.assertIsNone(tasks.get_mail_connection())
+        user = User.objects.create(username='user', email='u@ya.ru')
+        tasks.send_confirm_mail(user)
+        tasks.send_confirm_mail(user)
+        self.assertEqual(len(mail.outbox), 2)
+
+    @override_settings(
+        EMAIL_BACKEND='django.core.mail.backends.smtp.EmailBackend'
+    )
+    def test_smtp_connection_is_reused(self):
+        with mock.patch('django.core.mail.backends.smtp.EmailBackend.open'):
+            self.assertIs(tasks.get_mail_connection(),
+                          tasks.get_mail_connection())
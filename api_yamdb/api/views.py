@@ -1,17 +1,26 @@
+import hashlib
+
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import send_mail
-from django.db.models import Avg
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Prefetch
+from django.http import Http404
 from django.shortcuts import get_object_or_404
+from django.utils.functional import cached_property
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, mixins, permissions, status, viewsets
 from rest_framework.decorators import action, api_view, permission_classes
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework_simplejwt.tokens import AccessToken
-from reviews.models import Category, Genre, Review, Title, User
-from api_yamdb.settings import DOMAIN_NAME
+from reviews.models import Category, Genre, GenreTitle, Review, Title, User
+from api_yamdb.settings import CONFIRMATION_CODE_CACHE_TIMEOUT
 
 from .filters import TitleFilter
+from .mixins import (CachedListMixin, ValuesListMixin,
+                     invalidate_list_cache)
+from .pagination import IdCursorPagination, PubDateCursorPagination
 from .permissions import (IsAdmin, IsAdminModeratorOwnerOrReadOnly,
                           IsAdminOrReadOnly)
 from .serializers import (CategorySerializer, CommentSerializer,
@@ -19,6 +28,33 @@ from .serializers import (CategorySerializer, CommentSerializer,
                           RegisterDataSerializer, ReviewSerializer,
                           TitlesSerializer, TokenSerializer,
                           UserEditSerializer, UserSerializer)
+from .tasks import queue_confirm_mail
+
+
+def save_user(serializer):
+    """
+    Сохраняет пользователя, полагаясь на уникальные индексы username и email.
+
+    Вместо предварительных SELECT-запросов (UniqueValidator) ошибка уникальности
+    перехватывается как IntegrityError и превращается в ответ 400.
+    Поля с конфликтом определяются только в этом, редком, случае.
+    """
+    try:
+        with transaction.atomic():
+            return serializer.save()
+    except IntegrityError:
+        users = User.objects.all()
+        if serializer.instance is not None:
+            users = users.exclude(pk=serializer.instance.pk)
+        errors = {
+            field: ['Значения поля должны быть уникальны.']
+            for field in ('username', 'email')
+            if field in serializer.validated_data
+            and users.filter(
+                **{field: serializer.validated_data[field]}
+            ).exists()
+        }
+        raise ValidationError(errors or None)
 
 
 class UserViewSet(viewsets.ModelViewSet):
@@ -26,7 +62,7 @@ class UserViewSet(viewsets.ModelViewSet):
     ViewSet для управления пользователями (только для администраторов).
 
     Предоставляет CRUD-операции для пользователей, доступные только администраторам.
-        pagination_class (Pagination): Класс пагинации (PageNumberPagination).
+        pagination_class (Pagination): Класс пагинации (IdCursorPagination).
         permission_classes (list): Список классов разрешений (IsAdmin).
         filter_backends (tuple): Список бэкендов фильтрации (filters.SearchFilter).
         lookup_field (str): Поле для поиска пользователя (username).
@@ -34,11 +70,13 @@ class UserViewSet(viewsets.ModelViewSet):
 
     Методы:
         users_own_profile(self, request): Endpoint для получения и редактирования собственного профиля пользователя.
+        perform_create(self, serializer): Создает пользователя через save_user.
+        perform_update(self, serializer): Обновляет пользователя через save_user.
         update(self, request, username, **kwargs): Запрещает операцию PUT для обновления пользователя.
     """
-    queryset = User.objects.all()
+    queryset = User.objects.order_by('id')
     serializer_class = UserSerializer
-    pagination_class = PageNumberPagination
+    pagination_class = IdCursorPagination
     permission_classes = (IsAdmin,)
     filter_backends = (filters.SearchFilter,)
     lookup_field = 'username'
@@ -67,10 +105,22 @@ class UserViewSet(viewsets.ModelViewSet):
                 partial=True
             )
             serializer.is_valid(raise_exception=True)
-            serializer.save()
+            save_user(serializer)
             return Response(serializer.data, status=status.HTTP_200_OK)
         return Response(status=status.HTTP_400_BAD_REQUEST)
 
+    def perform_create(self, serializer):
+        """
+        Создает пользователя, переводя нарушение уникальности в ответ 400.
+        """
+        save_user(serializer)
+
+    def perform_update(self, serializer):
+        """
+        Обновляет пользователя, переводя нарушение уникальности в ответ 400.
+        """
+        save_user(serializer)
+
     def update(self, request, username, **kwargs):
         """
         Запрет операции PUT для обновления пользователя.
@@ -87,31 +137,67 @@ def register(request):
     Регистрация нового пользователя.
 
     Позволяет зарегистрировать нового пользователя, отправив код подтверждения на указанный email.
+    Письмо отправляется фоновой задачей Celery (send_confirm_mail_task);
+    если брокер недоступен - сразу, в текущем процессе (queue_confirm_mail).
     Если пользователь с таким email уже существует, повторно отправляет код подтверждения.
+    Уникальность username и email проверяется самой БД в get_or_create,
+    без отдельных SELECT-запросов перед созданием.
 
     """
     serializer = RegisterDataSerializer(data=request.data)
-    email = request.data.get('email')
-    username = request.data.get('username')
-    user = User.objects.filter(email=email)
-
-    if User.objects.filter(username=username,
-                           email=email).exists():
-        user = user.get(email=email)
-        send_confirm_mail(user)
+    serializer.is_valid(raise_exception=True)
+    username = serializer.validated_data.get('username')
+    email = serializer.validated_data.get('email')
+    try:
+        user, created = User.objects.get_or_create(
+            username=username,
+            defaults={'email': email}
+        )
+    except IntegrityError:
+        return Response(
+            {'email': ['Пользователь с такой электронной почтой уже '
+                       'существует.']},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    if not created and user.email != email:
+        return Response(
+            {'username': ['Пользователь с таким именем уже существует.']},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    queue_confirm_mail(user)
+    if not created:
         return Response(
             {'message': 'Пользователь с такой электронной почтой уже '
                         'существует. Код подтверждения отправлен повторно. '
              }
         )
-    serializer.is_valid(raise_exception=True)
-    username = serializer.validated_data.get('username')
-    email = serializer.validated_data.get('email')
-    user, _ = User.objects.get_or_create(username=username, email=email)
-    send_confirm_mail(user)
     return Response(serializer.data, status=status.HTTP_200_OK)
 
 
+def check_confirmation_code(user, confirmation_code):
+    """
+    Проверка кода подтверждения с кэшированием успешных проверок.
+
+    Клиенты часто повторно отправляют тот же код; пока пара
+    (пользователь, код) лежит в кэше, HMAC заново не вычисляется.
+    Кэшируются только успешные проверки, время жизни ограничено
+    CONFIRMATION_CODE_CACHE_TIMEOUT.
+    Ключ включает хэш тех же данных пользователя, что и сам код
+    (пароль, last_login, email): после их изменения закэшированная
+    проверка больше не находится. Хэш также ограничивает длину ключа.
+    """
+    digest = hashlib.md5('{}:{}:{}:{}'.format(
+        confirmation_code, user.password, user.last_login, user.email
+    ).encode()).hexdigest()
+    cache_key = f'confirmation_code:{user.pk}:{digest}'
+    if cache.get(cache_key):
+        return True
+    if default_token_generator.check_token(user, confirmation_code):
+        cache.set(cache_key, True, CONFIRMATION_CODE_CACHE_TIMEOUT)
+        return True
+    return False
+
+
 @api_view(['POST'])
 @permission_classes([permissions.AllowAny])
 def get_jwt_token(request):
@@ -127,7 +213,7 @@ def get_jwt_token(request):
         username=serializer.validated_data['username']
     )
 
-    if default_token_generator.check_token(
+    if check_confirmation_code(
         user, serializer.validated_data['confirmation_code']
     ):
         token = AccessToken.for_user(user)
@@ -136,19 +222,9 @@ def get_jwt_token(request):
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-def send_confirm_mail(user):
-    """
-    Отправка кода подтверждения на email пользователя.
-    """
-    confirmation_code = default_token_generator.make_token(user)
-    subject = 'YaMDb registration'
-    message = f'Ваш код подтверждения: {confirmation_code}'
-    from_email = DOMAIN_NAME
-    recipient_list = [user.email]
-    return send_mail(subject, message, from_email, recipient_list)
-
-
-class CategoryViewSet(mixins.ListModelMixin,
+class CategoryViewSet(CachedListMixin,
+                      ValuesListMixin,
+                      mixins.ListModelMixin,
                       mixins.CreateModelMixin,
                       mixins.DestroyModelMixin,
                       viewsets.GenericViewSet
@@ -157,7 +233,8 @@ class CategoryViewSet(mixins.ListModelMixin,
     ViewSet для модели Category.
 
     Предоставляет операции:
-        - Получение списка категорий (list).
+        - Получение списка категорий (list). Список строится через QuerySet.values() (ValuesListMixin).
+          Ответ кэшируется (CachedListMixin).
         - Создание категории (create).
         - Удаление категории (destroy).
 
@@ -169,22 +246,26 @@ class CategoryViewSet(mixins.ListModelMixin,
         - Поиск по названию (name) (filters.SearchFilter).
 
     Атрибуты:
-        queryset (QuerySet):  Набор всех категорий.
+        queryset (QuerySet):  Набор всех категорий, отсортированных по названию.
         serializer_class (Serializer):  Сериализатор для модели Category (CategorySerializer).
         permission_classes (list):  Список классов прав доступа (IsAdminOrReadOnly).
         filter_backends (tuple):  Список бэкендов фильтрации (filters.SearchFilter).
         search_fields (tuple):  Поля, по которым осуществляется поиск (name).
         lookup_field (str):  Поле, используемое для поиска отдельных объектов (slug).
+        values_fields (tuple):  Поля, возвращаемые в списке (name, slug).
     """
-    queryset = Category.objects.all()
+    queryset = Category.objects.order_by('name')
     serializer_class = CategorySerializer
     permission_classes = (IsAdminOrReadOnly,)
     filter_backends = (filters.SearchFilter,)
     search_fields = ('name',)
     lookup_field = 'slug'
+    values_fields = ('name', 'slug')
 
 
-class GenreViewSet(mixins.ListModelMixin,
+class GenreViewSet(CachedListMixin,
+                   ValuesListMixin,
+                   mixins.ListModelMixin,
                    mixins.CreateModelMixin,
                    mixins.DestroyModelMixin,
                    viewsets.GenericViewSet
@@ -193,7 +274,8 @@ class GenreViewSet(mixins.ListModelMixin,
     ViewSet для модели Genre.
 
     Предоставляет операции:
-        - Получение списка жанров (list).
+        - Получение списка жанров (list). Список строится через QuerySet.values() (ValuesListMixin).
+          Ответ кэшируется (CachedListMixin).
         - Создание жанра (create).
         - Удаление жанра (destroy).
 
@@ -205,22 +287,24 @@ class GenreViewSet(mixins.ListModelMixin,
         - Поиск по названию (name) (filters.SearchFilter).
 
     Атрибуты:
-        queryset (QuerySet):  Набор всех жанров.
+        queryset (QuerySet):  Набор всех жанров, отсортированных по id.
         serializer_class (Serializer):  Сериализатор для модели Genre (GenreSerializer).
         permission_classes (list):  Список классов прав доступа (IsAdminOrReadOnly).
         filter_backends (tuple):  Список бэкендов фильтрации (filters.SearchFilter).
         search_fields (tuple):  Поля, по которым осуществляется поиск (name).
         lookup_field (str):  Поле, используемое для поиска отдельных объектов (slug).
+        values_fields (tuple):  Поля, возвращаемые в списке (name, slug).
     """
-    queryset = Genre.objects.all()
+    queryset = Genre.objects.order_by('id')
     serializer_class = GenreSerializer
     permission_classes = (IsAdminOrReadOnly,)
     filter_backends = (filters.SearchFilter,)
     search_fields = ('name',)
     lookup_field = 'slug'
+    values_fields = ('name', 'slug')
 
 
-class TitleViewSet(viewsets.ModelViewSet):
+class TitleViewSet(CachedListMixin, ValuesListMixin, viewsets.ModelViewSet):
     """
     ViewSet для модели Title (произведение).
 
@@ -236,12 +320,17 @@ class TitleViewSet(viewsets.ModelViewSet):
         - Использует DjangoFilterBackend и TitleFilter для расширенной фильтрации произведений.
 
     Атрибуты:
-        queryset (QuerySet):  Набор всех произведений, аннотированных средним рейтингом (rating).
-                               Рейтинг вычисляется на основе связанных отзывов (`reviews__score`).
+        queryset (QuerySet):  Набор всех произведений. Средний рейтинг (rating) хранится в самой
+                               таблице и обновляется при сохранении/удалении отзывов.
+                               Категория подгружается через JOIN (select_related), жанры -
+                               одним дополнительным запросом на страницу (prefetch_related).
+                               Из БД выбираются только поля, которые выводят сериализаторы (only).
         serializer_class (Serializer):  Сериализатор по умолчанию для модели Title (TitlesSerializer).
+        pagination_class (Pagination):  Курсорная пагинация по id (IdCursorPagination).
         permission_classes (list):  Список классов прав доступа (IsAdminOrReadOnly).
         filter_backends (tuple):  Список бэкендов фильтрации (DjangoFilterBackend).
         filterset_class (FilterSet):  Класс фильтра для модели Title (TitleFilter).
+        values_fields (tuple):  Поля, выбираемые из БД для списка произведений.
 
     Методы:
         get_serializer_class(self):  Определяет, какой сериализатор использовать в зависимости от действия (action).
@@ -249,12 +338,70 @@ class TitleViewSet(viewsets.ModelViewSet):
                                       используется ReadOnlyTitleSerializer, который включает рейтинг, жанры и категорию.
                                       Для остальных операций используется TitlesSerializer, который позволяет изменять
                                       основные поля произведения.
+        build_list_data(self, rows):  Собирает список произведений из QuerySet.values() (ValuesListMixin)
+                                       в формате ReadOnlyTitleSerializer. Ответ списка кэшируется (CachedListMixin).
+        perform_create(self, serializer), perform_update(self, serializer):  Сохраняют произведение
+                                      через save_title.
+        save_title(self, serializer):  Сохраняет произведение. Категория и жанры могли быть взяты
+                                        из кэша (CachedSlugRelatedField) и уже удалены: при ошибке
+                                        внешнего ключа кэш сбрасывается, данные проверяются заново
+                                        (ответ 400, если объекта больше нет) и сохранение повторяется.
+        get_queryset(self):  Для удаления выбирает только id: описание, категория и жанры
+                              удаляемого произведения не нужны. При изменении не загружает
+                              rating и reviews_count: save() записывает только загруженные поля,
+                              поэтому рейтинг, пересчитанный сигналом отзыва, не перезаписывается.
     """
-    queryset = Title.objects.all().annotate(rating=Avg('reviews__score'))
+    queryset = Title.objects.select_related('category').prefetch_related(
+        Prefetch('genre',
+                 queryset=Genre.objects.only('name', 'slug').order_by('id'))
+    ).only(
+        'id', 'name', 'year', 'description', 'rating',
+        'category__name', 'category__slug'
+    )
     serializer_class = TitlesSerializer
+    pagination_class = IdCursorPagination
     permission_classes = (IsAdminOrReadOnly,)
     filter_backends = (DjangoFilterBackend,)
     filterset_class = TitleFilter
+    values_fields = ('id', 'rating', 'name', 'year', 'description',
+                     'category__name', 'category__slug')
+
+    def get_queryset(self):
+        """
+        Возвращает queryset произведений; для удаления - без лишних полей и запросов,
+        для изменения - без полей, которые обновляются сигналами отзывов.
+        """
+        if self.action == 'destroy':
+            return Title.objects.only('id')
+        if self.action in ('update', 'partial_update'):
+            return super().get_queryset().defer('rating', 'reviews_count')
+        return super().get_queryset()
+
+    def perform_create(self, serializer):
+        self.save_title(serializer)
+
+    def perform_update(self, serializer):
+        self.save_title(serializer)
+
+    def save_title(self, serializer):
+        """
+        Сохраняет произведение, перепроверяя категорию и жанры из кэша
+        при ошибке внешнего ключа.
+        """
+        try:
+            with transaction.atomic():
+                serializer.save()
+            return
+        except IntegrityError:
+            invalidate_list_cache('categories', 'genres')
+        fresh = self.get_serializer(
+            serializer.instance,
+            data=serializer.initial_data,
+            partial=serializer.partial
+        )
+        fresh.is_valid(raise_exception=True)
+        with transaction.atomic():
+            serializer.instance = fresh.save()
 
     def get_serializer_class(self):
         """
@@ -264,6 +411,37 @@ class TitleViewSet(viewsets.ModelViewSet):
             return ReadOnlyTitleSerializer
         return TitlesSerializer
 
+    def build_list_data(self, rows):
+        """
+        Собирает список произведений в формате ReadOnlyTitleSerializer.
+
+        Экземпляры моделей не создаются: произведения с категорией выбираются
+        одним запросом, жанры для всей страницы - одним запросом к GenreTitle.
+        """
+        genres = {}
+        genre_links = GenreTitle.objects.filter(
+            title_id__in=[title['id'] for title in rows]
+        ).order_by('genre_id').values('title_id', 'genre__name', 'genre__slug')
+        for link in genre_links:
+            genres.setdefault(link['title_id'], []).append(
+                {'name': link['genre__name'], 'slug': link['genre__slug']}
+            )
+        return [
+            {
+                'id': title['id'],
+                'rating': (None if title['rating'] is None
+                           else int(title['rating'])),
+                'genre': genres.get(title['id'], []),
+                'category': (None if title['category__slug'] is None
+                             else {'name': title['category__name'],
+                                   'slug': title['category__slug']}),
+                'name': title['name'],
+                'year': title['year'],
+                'description': title['description'],
+            }
+            for title in rows
+        ]
+
 
 class ReviewViewSet(viewsets.ModelViewSet):
     """
@@ -279,31 +457,68 @@ class ReviewViewSet(viewsets.ModelViewSet):
 
     Атрибуты:
         serializer_class (Serializer):  Сериализатор для модели Review (ReviewSerializer).
+        pagination_class (Pagination):  Курсорная пагинация по дате публикации (PubDateCursorPagination).
         permission_classes (list):  Список классов прав доступа (IsAdminModeratorOwnerOrReadOnly).
 
+    Свойства:
+        title (Title):  Произведение по параметру `title_id` в URL, кэшируется на время запроса (cached_property).
+
     Методы:
         get_queryset(self):  Возвращает queryset, содержащий только отзывы, связанные с указанным произведением.
                               Произведение определяется по параметру `title_id` в URL.
+                              Автор подгружается тем же запросом (select_related, только id и username),
+                              а произведение менеджер связи подставляет из self.title без JOIN.
         perform_create(self, serializer):  Создает новый отзыв, автоматически связывая его с текущим пользователем
-                                            (автором) и произведением.
+                                            (автором) и произведением. Повторный отзыв возвращает ответ 400.
     """
     serializer_class = ReviewSerializer
+    pagination_class = PubDateCursorPagination
     permission_classes = [IsAdminModeratorOwnerOrReadOnly]
 
+    @cached_property
+    def title(self):
+        """
+        Произведение из URL. ViewSet создается на каждый запрос,
+        поэтому объект запрашивается из БД один раз за запрос.
+        """
+        return get_object_or_404(
+            Title.objects.only('id', 'name'),
+            id=self.kwargs.get('title_id')
+        )
+
     def get_queryset(self):
         """
         Возвращает отзывы только для конкретного произведения.
         """
-        title = get_object_or_404(Title, id=self.kwargs.get('title_id'))
-        return title.reviews.all()
+        return self.title.reviews.select_related('author').only(
+            'id', 'title', 'text', 'score', 'pub_date',
+            'author__id', 'author__username'
+        )
 
     def perform_create(self, serializer):
         """
         Сохраняет новый отзыв, связывая его с текущим пользователем и произведением.
+
+        Уникальность пары (произведение, автор) проверяет ограничение
+        unique_review в БД: IntegrityError превращается в ответ 400,
+        только если отзыв автора действительно уже существует.
+        Прочие нарушения целостности пробрасываются дальше.
         """
-        title_id = self.kwargs.get('title_id')
-        title = get_object_or_404(Title, id=title_id)
-        serializer.save(author=self.request.user, title=title)
+        try:
+            with transaction.atomic():
+                serializer.save(
+                    author=self.request.user, title=self.title
+                )
+        except IntegrityError:
+            if not Review.objects.filter(
+                title=self.title, author=self.request.user
+            ).exists():
+                raise
+            raise ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [
+                    'На произведение можно оставить только один отзыв.'
+                ]
+            })
 
 
 class CommentViewSet(viewsets.ModelViewSet):
@@ -320,31 +535,52 @@ class CommentViewSet(viewsets.ModelViewSet):
 
     Атрибуты:
         serializer_class (Serializer): Сериализатор для модели Comment (CommentSerializer).
+        pagination_class (Pagination): Курсорная пагинация по дате публикации (PubDateCursorPagination).
         permission_classes (list): Список классов прав доступа (IsAdminModeratorOwnerOrReadOnly).
 
+    Свойства:
+        review (Review): Отзыв по параметрам `review_id` и `title_id` в URL, кэшируется на время запроса (cached_property).
+
     Методы:
         get_queryset(self): Возвращает queryset, содержащий только комментарии, связанные с указанным отзывом.
                              Отзыв определяется по параметрам `review_id` и `title_id` в URL.
+                             Автор подгружается тем же запросом (select_related, только id и username),
+                             а отзыв менеджер связи подставляет из self.review без JOIN.
         perform_create(self, serializer): Создает новый комментарий, автоматически связывая его с текущим пользователем
                                           (автором) и отзывом.
     """
     serializer_class = CommentSerializer
+    pagination_class = PubDateCursorPagination
     permission_classes = [IsAdminModeratorOwnerOrReadOnly]
 
+    @cached_property
+    def review(self):
+        """
+        Отзыв из URL. ViewSet создается на каждый запрос,
+        поэтому объект запрашивается из БД один раз за запрос.
+
+        Отзыв ищется по первичному ключу, принадлежность произведению
+        проверяется сравнением title_id уже полученного объекта.
+        """
+        review = get_object_or_404(
+            Review.objects.only('id', 'title_id', 'text'),
+            pk=self.kwargs.get('review_id')
+        )
+        if review.title_id != int(self.kwargs.get('title_id')):
+            raise Http404
+        return review
+
     def get_queryset(self):
         """
         Возвращает комментарии только для конкретного отзыва.
         """
-        review = get_object_or_404(Review, id=self.kwargs.get('review_id'),
-                                   title=self.kwargs.get('title_id')
-                                   )
-        return review.comments.all()
+        return self.review.comments.select_related('author').only(
+            'id', 'review', 'text', 'pub_date',
+            'author__id', 'author__username'
+        )
 
     def perform_create(self, serializer):
         """
         Сохраняет новый комментарий, связывая его с текущим пользователем и отзывом.
         """
-        title_id = self.kwargs.get('title_id')
-        review_id = self.kwargs.get('review_id')
-        review = get_object_or_404(Review, id=review_id, title=title_id)
-        serializer.save(author=self.request.user, review=review)
+        serializer.save(author=self.request.user, review=self.review)
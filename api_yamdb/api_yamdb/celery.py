@@ -0,0 +1,16 @@
+"""
+Celery config for YaMDb project.
+
+Задачи (например, отправка писем с кодом подтверждения) выполняются
+воркером вне цикла запрос-ответ.
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'api_yamdb.settings')
+
+app = Celery('api_yamdb')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
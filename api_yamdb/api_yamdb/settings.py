@@ -116,6 +116,44 @@ EMAIL_FILE_PATH = os.path.join(BASE_DIR, 'sent_emails')
 
 DOMAIN_NAME = 'admin@yamdb.com'
 
+# По умолчанию кэш хранится в памяти процесса (LocMemCache) и подходит только
+# для одного процесса приложения (runserver). При нескольких процессах
+# (gunicorn с несколькими воркерами) задайте общий бэкенд, например
+# CACHE_BACKEND=django.core.cache.backends.memcached.PyMemcacheCache
+# и CACHE_LOCATION=127.0.0.1:11211, иначе сброс кэша списков и категорий
+# не дойдет до других процессов.
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv(
+            'CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': os.getenv('CACHE_LOCATION', ''),
+    }
+}
+
+# время (в секундах) хранения ответов со списками категорий, жанров
+# и произведений
+LIST_CACHE_TIMEOUT = 300
+
+# время (в секундах) хранения категорий и жанров, найденных по slug
+# при записи произведений
+SLUG_CACHE_TIMEOUT = 3600
+
+# размер пачки INSERT-запросов при загрузке CSV командами manage.py
+CSV_IMPORT_BATCH_SIZE = 1000
+
+# время (в секундах), на которое запоминается успешная проверка
+# кода подтверждения
+CONFIRMATION_CODE_CACHE_TIMEOUT = 60
+
+# Celery: письма с кодом подтверждения отправляются воркером.
+# Пока брокер не задан явно (локальная разработка), задачи выполняются
+# сразу в процессе приложения и не требуют Redis и воркера.
+CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://localhost:6379/0')
+CELERY_TASK_ALWAYS_EAGER = os.getenv(
+    'CELERY_TASK_ALWAYS_EAGER', str('CELERY_BROKER_URL' not in os.environ)
+) == 'True'
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework_simplejwt.authentication.JWTAuthentication",
@@ -123,6 +161,10 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.'
                                 'PageNumberPagination',
     "PAGE_SIZE": 10,
@@ -21,6 +21,7 @@ class CategoryAdmin(ImportExportModelAdmin):
     '''
     resources_class = CategoryResource
     list_display = ('id', 'name', 'slug')
+    ordering = ('name',)
 
 
 admin.site.register(Category, CategoryAdmin)
@@ -43,6 +44,7 @@ class TitlesAdmin(ImportExportModelAdmin):
     '''
     resources_class = TitleResource
     list_display = ('id', 'name', 'year', 'category')
+    ordering = ('name',)
 
 
 admin.site.register(Title, TitlesAdmin)
@@ -65,6 +67,7 @@ class GenreAdmin(ImportExportModelAdmin):
     '''
     resources_class = GenreResource
     list_display = ('id', 'name', 'slug')
+    ordering = ('id',)
 
 
 admin.site.register(Genre, GenreAdmin)
@@ -112,6 +115,7 @@ class ReviewAdmin(ImportExportModelAdmin):
     '''
     resources_class = ReviewResource
     list_display = ('id', 'title', 'text', 'author', 'score', 'pub_date')
+    ordering = ('pub_date',)
 
 
 admin.site.register(Review, ReviewAdmin)
@@ -134,6 +138,7 @@ class CommentsAdmin(ImportExportModelAdmin):
     '''
     resources_class = CommentResource
     list_display = ('id', 'pub_date', 'review', 'text', 'author')
+    ordering = ('pub_date',)
 
 
 admin.site.register(Comment, CommentsAdmin)
@@ -150,6 +155,7 @@ class UserAdmin(ImportExportModelAdmin):
     resources_class = UserResource
     list_display = ('id', 'username', 'email', 'role', 'bio',
                     'first_name', 'last_name')
+    ordering = ('id',)
 
 
 admin.site.unregister(User)
@@ -3,7 +3,7 @@ import csv
 from django.core.management.base import BaseCommand
 from reviews.models import Category
 
-from api_yamdb.settings import BASE_DIR
+from api_yamdb.settings import BASE_DIR, CSV_IMPORT_BATCH_SIZE
 
 models = Category
 
@@ -15,6 +15,10 @@ class Command(BaseCommand):
         source_csv_filename = (BASE_DIR / 'static/data/category.csv')
         with open(source_csv_filename, encoding="utf-8") as f:
             reader = csv.DictReader(f)
-            for row in reader:
-                Category.objects.create(id=row['id'], name=row['name'],
-                                        slug=row['slug'])
+            objs = [
+                Category(id=row['id'], name=row['name'], slug=row['slug'])
+                for row in reader
+            ]
+        Category.objects.bulk_create(
+            objs, batch_size=CSV_IMPORT_BATCH_SIZE, ignore_conflicts=True
+        )
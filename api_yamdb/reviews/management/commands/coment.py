@@ -3,7 +3,7 @@ import csv
 from django.core.management.base import BaseCommand
 from reviews.models import Comment
 
-from api_yamdb.settings import BASE_DIR
+from api_yamdb.settings import BASE_DIR, CSV_IMPORT_BATCH_SIZE
 
 models = Comment
 
@@ -15,10 +15,16 @@ class Command(BaseCommand):
         source_csv_filename = (BASE_DIR / 'static/data/comments.csv')
         with open(source_csv_filename, encoding="utf-8") as f:
             reader = csv.DictReader(f)
-            for row in reader:
-                Comment.objects.create(
+            objs = [
+                Comment(
+                    id=row['id'],
                     review_id=int(row['review_id']),
                     text=row['text'],
                     author_id=int(row['author']),
                     pub_date=row['pub_date']
                 )
+                for row in reader
+            ]
+        Comment.objects.bulk_create(
+            objs, batch_size=CSV_IMPORT_BATCH_SIZE, ignore_conflicts=True
+        )
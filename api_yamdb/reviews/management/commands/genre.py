@@ -4,7 +4,7 @@ import csv
 from django.core.management.base import BaseCommand
 from reviews.models import Genre
 
-from api_yamdb.settings import BASE_DIR
+from api_yamdb.settings import BASE_DIR, CSV_IMPORT_BATCH_SIZE
 
 models = Genre
 
@@ -16,6 +16,10 @@ class Command(BaseCommand):
         source_csv_filename = (BASE_DIR / 'static/data/genre.csv')
         with open(source_csv_filename, encoding="utf-8") as f:
             reader = csv.DictReader(f)
-            for row in reader:
-                Genre.objects.create(id=row['id'], name=row['name'],
-                                     slug=row['slug'])
+            objs = [
+                Genre(id=row['id'], name=row['name'], slug=row['slug'])
+                for row in reader
+            ]
+        Genre.objects.bulk_create(
+            objs, batch_size=CSV_IMPORT_BATCH_SIZE, ignore_conflicts=True
+        )
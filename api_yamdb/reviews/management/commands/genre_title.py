@@ -4,7 +4,7 @@ import csv
 from django.core.management.base import BaseCommand
 from reviews.models import GenreTitle
 
-from api_yamdb.settings import BASE_DIR
+from api_yamdb.settings import BASE_DIR, CSV_IMPORT_BATCH_SIZE
 
 models = GenreTitle
 
@@ -16,9 +16,14 @@ class Command(BaseCommand):
         source_csv_filename = (BASE_DIR / 'static/data/genre_title.csv')
         with open(source_csv_filename, encoding="utf-8") as f:
             reader = csv.DictReader(f)
-            for row in reader:
-                GenreTitle.objects.create(
+            objs = [
+                GenreTitle(
                     id=row['id'],
                     title_id=int(row['title_id']),
                     genre_id=int(row['genre_id'])
                 )
+                for row in reader
+            ]
+        GenreTitle.objects.bulk_create(
+            objs, batch_size=CSV_IMPORT_BATCH_SIZE, ignore_conflicts=True
+        )
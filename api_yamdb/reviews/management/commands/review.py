@@ -1,9 +1,9 @@
 import csv
 
 from django.core.management.base import BaseCommand
-from reviews.models import Review
+from reviews.models import Review, Title
 
-from api_yamdb.settings import BASE_DIR
+from api_yamdb.settings import BASE_DIR, CSV_IMPORT_BATCH_SIZE
 
 models = Review
 
@@ -15,11 +15,19 @@ class Command(BaseCommand):
         source_csv_filename = (BASE_DIR / 'static/data/review.csv')
         with open(source_csv_filename, encoding="utf-8") as f:
             reader = csv.DictReader(f)
-            for row in reader:
-                Review.objects.create(
+            objs = [
+                Review(
+                    id=row['id'],
                     title_id=int(row['title_id']),
                     text=row['text'],
                     author_id=int(row['author']),
                     score=row['score'],
                     pub_date=row['pub_date']
                 )
+                for row in reader
+            ]
+        Review.objects.bulk_create(
+            objs, batch_size=CSV_IMPORT_BATCH_SIZE, ignore_conflicts=True
+        )
+        # bulk_create не вызывает сигналы, пересчитывающие рейтинг
+        Title.update_rating(*{review.title_id for review in objs})
@@ -3,7 +3,7 @@ import csv
 from django.core.management.base import BaseCommand
 from reviews.models import Title
 
-from api_yamdb.settings import BASE_DIR
+from api_yamdb.settings import BASE_DIR, CSV_IMPORT_BATCH_SIZE
 
 models = Title
 
@@ -15,10 +15,15 @@ class Command(BaseCommand):
         source_csv_filename = (BASE_DIR / 'static/data/titles.csv')
         with open(source_csv_filename, encoding="utf-8") as f:
             reader = csv.DictReader(f)
-            for row in reader:
-                Title.objects.create(
+            objs = [
+                Title(
                     id=row['id'],
                     name=row['name'],
                     year=row['year'],
                     category_id=int(row['category'])
                 )
+                for row in reader
+            ]
+        Title.objects.bulk_create(
+            objs, batch_size=CSV_IMPORT_BATCH_SIZE, ignore_conflicts=True
+        )
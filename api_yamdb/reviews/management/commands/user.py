@@ -3,7 +3,7 @@ import csv
 from django.core.management.base import BaseCommand
 from reviews.models import User
 
-from api_yamdb.settings import BASE_DIR
+from api_yamdb.settings import BASE_DIR, CSV_IMPORT_BATCH_SIZE
 
 models = User
 
@@ -15,12 +15,18 @@ class Command(BaseCommand):
         source_csv_filename = (BASE_DIR / 'static/data/users.csv')
         with open(source_csv_filename, encoding="utf-8") as f:
             reader = csv.DictReader(f)
-            for row in reader:
-                User.objects.create(
+            objs = [
+                User(
+                    id=row['id'],
                     username=row['username'],
                     email=row['email'],
-                    role=row['role'],
+                    role=User.Role[row['role'].upper()],
                     bio=row['bio'],
                     first_name=row['first_name'],
                     last_name=row['last_name']
                 )
+                for row in reader
+            ]
+        User.objects.bulk_create(
+            objs, batch_size=CSV_IMPORT_BATCH_SIZE, ignore_conflicts=True
+        )
@@ -0,0 +1,37 @@
+# Generated by Django 3.2 on 2026-10-15 02:10
+
+from django.db import migrations, models
+from django.db.models import Avg, Count
+
+
+def fill_title_rating(apps, schema_editor):
+    Title = apps.get_model('reviews', 'Title')
+    Review = apps.get_model('reviews', 'Review')
+    stats = Review.objects.order_by().values('title_id').annotate(
+        avg=Avg('score'), cnt=Count('id')
+    )
+    for row in stats:
+        Title.objects.filter(pk=row['title_id']).update(
+            rating=row['avg'], reviews_count=row['cnt']
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0006_alter_title_year'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='title',
+            name='rating',
+            field=models.FloatField(db_index=True, null=True, verbose_name='Рейтинг'),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='reviews_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Количество отзывов'),
+        ),
+        migrations.RunPython(fill_title_rating, migrations.RunPython.noop),
+    ]
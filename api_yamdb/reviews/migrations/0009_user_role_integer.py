@@ -0,0 +1,38 @@
+# Generated by Django 3.2 on 2026-10-15 02:17
+
+from django.db import migrations, models
+from django.db.models import Case, Value, When
+
+ROLES = (('user', '0'), ('moderator', '1'), ('admin', '2'))
+
+
+def roles_to_numbers(apps, schema_editor):
+    User = apps.get_model('reviews', 'User')
+    User.objects.update(role=Case(
+        *(When(role=name, then=Value(number)) for name, number in ROLES),
+        default=Value('0'),
+    ))
+
+
+def roles_to_names(apps, schema_editor):
+    User = apps.get_model('reviews', 'User')
+    User.objects.update(role=Case(
+        *(When(role=number, then=Value(name)) for name, number in ROLES),
+        default=Value('user'),
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0008_review_comment_pub_date_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(roles_to_numbers, roles_to_names),
+        migrations.AlterField(
+            model_name='user',
+            name='role',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'user'), (1, 'moderator'), (2, 'admin')], default=0, verbose_name='Роль'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 3.2 on 2026-10-15 02:17
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def remove_duplicate_links(apps, schema_editor):
+    GenreTitle = apps.get_model('reviews', 'GenreTitle')
+    duplicates = GenreTitle.objects.order_by().values(
+        'title_id', 'genre_id'
+    ).annotate(first_id=Min('id'), cnt=Count('id')).filter(cnt__gt=1)
+    for row in duplicates:
+        GenreTitle.objects.filter(
+            title_id=row['title_id'], genre_id=row['genre_id']
+        ).exclude(id=row['first_id']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0010_title_category_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_links, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='genretitle',
+            index=models.Index(fields=['genre', 'title'], name='genretitle_genre_title_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='genretitle',
+            constraint=models.UniqueConstraint(fields=('title', 'genre'), name='uniq_genre_title'),
+        ),
+    ]
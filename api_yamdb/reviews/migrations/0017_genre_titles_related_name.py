@@ -0,0 +1,18 @@
+# Generated by Django 3.2 on 2026-10-15 02:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0016_alter_title_year_smallint'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='title',
+            name='genre',
+            field=models.ManyToManyField(related_name='titles', through='reviews.GenreTitle', to='reviews.Genre', verbose_name='Жанр'),
+        ),
+    ]
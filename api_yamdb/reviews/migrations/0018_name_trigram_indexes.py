@@ -0,0 +1,39 @@
+from django.db import migrations
+
+# Индексы pg_trgm для поиска подстрок в названиях: фильтр name списка
+# произведений (LIKE) и поиск категорий и жанров (SearchFilter, UPPER(...) LIKE).
+# Создаются только на PostgreSQL, на других СУБД миграция ничего не делает.
+TRIGRAM_INDEXES = (
+    ('title_name_trgm', 'reviews_title', 'name'),
+    ('category_name_trgm', 'reviews_category', 'UPPER(name)'),
+    ('genre_name_trgm', 'reviews_genre', 'UPPER(name)'),
+)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, expression in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} '
+            f'USING GIN (({expression}) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _, _ in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0017_genre_titles_related_name'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
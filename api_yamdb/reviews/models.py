@@ -1,6 +1,9 @@
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models import Avg, Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.utils.functional import cached_property
 from .validators import validate_year
 
 
@@ -13,33 +16,30 @@ class User(AbstractUser):
     для соответствия требованиям проекта.
 
     Атрибуты:
-        ADMIN (str): Константа для роли администратора.
-        MODERATOR (str): Константа для роли модератора.
-        USER (str): Константа для роли обычного пользователя.
-        roles (tuple): Список кортежей, определяющих возможные роли пользователя.
+        Role (IntegerChoices): Возможные роли пользователя. В БД хранится число,
+                               в API - строковая метка ('user', 'moderator', 'admin').
 
         username (CharField): Имя пользователя, должно быть уникальным.
         email (EmailField): Адрес электронной почты, используется для аутентификации.
-        role (CharField): Роль пользователя (администратор, модератор или обычный пользователь).
+        role (PositiveSmallIntegerField): Роль пользователя (администратор, модератор
+                                          или обычный пользователь).
         bio (TextField): Информация о пользователе.
 
-    Свойства:
+    Свойства (cached_property, вычисляются один раз для экземпляра):
         is_moderator (bool): Возвращает True, если роль пользователя - модератор.
         is_admin (bool): Возвращает True, если роль пользователя - администратор.
 
+    Методы:
+        save(self): Сохраняет пользователя и сбрасывает закэшированные свойства роли.
+
     Meta:
-        ordering (list): Порядок сортировки пользователей по умолчанию.
         verbose_name (str): Отображаемое имя модели в единственном числе.
         verbose_name_plural (str): Отображаемое имя модели во множественном числе.
     """
-    ADMIN = 'admin'
-    MODERATOR = 'moderator'
-    USER = 'user'
-    roles = (
-        (ADMIN, 'Administrator'),
-        (MODERATOR, 'Moderator'),
-        (USER, 'User'),
-    )
+    class Role(models.IntegerChoices):
+        USER = 0, 'user'
+        MODERATOR = 1, 'moderator'
+        ADMIN = 2, 'admin'
 
     username = models.CharField(
         verbose_name='Имя пользователя',
@@ -54,11 +54,10 @@ class User(AbstractUser):
         max_length=254,
     )
 
-    role = models.CharField(
+    role = models.PositiveSmallIntegerField(
         verbose_name='Роль',
-        max_length=50,
-        choices=roles,
-        default=USER
+        choices=Role.choices,
+        default=Role.USER.value
     )
 
     bio = models.TextField(
@@ -67,25 +66,33 @@ class User(AbstractUser):
         blank=True,
     )
 
-    @property
+    @cached_property
     def is_moderator(self):
         """
         Возвращает True, если роль пользователя - MODERATOR.
         """
-        return self.role == self.MODERATOR
+        return self.role == self.Role.MODERATOR
 
-    @property
+    @cached_property
     def is_admin(self):
         """
         Возвращает True, если роль пользователя - ADMIN.
         """
-        return self.role == self.ADMIN
+        return self.role == self.Role.ADMIN
+
+    def save(self, *args, **kwargs):
+        """
+        Сохраняет пользователя и сбрасывает закэшированные is_admin/is_moderator,
+        так как роль могла измениться.
+        """
+        super().save(*args, **kwargs)
+        self.__dict__.pop('is_admin', None)
+        self.__dict__.pop('is_moderator', None)
 
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username']
 
     class Meta:
-        ordering = ['id']
         verbose_name = 'Пользователь'
         verbose_name_plural = 'Пользователи'
 
@@ -97,9 +104,6 @@ class Category(models.Model):
     Атрибуты:
         name (CharField): Название категории.
         slug (SlugField): Slug категории, используется в URL.
-
-    Meta:
-        ordering (list): Порядок сортировки категорий по умолчанию.
     """
     name = models.CharField(
         verbose_name='Название',
@@ -117,9 +121,6 @@ class Category(models.Model):
         """
         return self.name
 
-    class Meta:
-        ordering = ['name']
-
 
 class Genre(models.Model):
     """
@@ -128,9 +129,6 @@ class Genre(models.Model):
     Атрибуты:
         name (CharField): Название жанра.
         slug (SlugField): Slug жанра, используется в URL.
-
-    Meta:
-        ordering (list): Порядок сортировки жанров по умолчанию.
     """
     name = models.CharField(
         verbose_name='Название',
@@ -148,9 +146,6 @@ class Genre(models.Model):
         """
         return self.name
 
-    class Meta:
-        ordering = ['id']
-
 
 class Title(models.Model):
     """
@@ -158,19 +153,27 @@ class Title(models.Model):
 
     Атрибуты:
         name (CharField): Название произведения.
-        year (PositiveIntegerField): Год выхода произведения.
+        year (PositiveSmallIntegerField): Год выхода произведения.
         description (TextField): Описание произведения.
         genre (ManyToManyField): Жанры произведения (связь Many-to-Many с Genre через GenreTitle).
         category (ForeignKey): Категория произведения (связь One-to-Many с Category).
+        rating (FloatField): Средняя оценка по отзывам. Хранится в таблице, чтобы
+                             список произведений не агрегировал отзывы при каждом запросе.
+                             Обновляется сигналами отзывов (reviews/signals.py).
+        reviews_count (PositiveIntegerField): Количество отзывов на произведение.
+
+    Методы:
+        update_rating(cls, *title_ids): Пересчитывает rating и reviews_count произведений.
 
     Meta:
-        ordering (list): Порядок сортировки произведений по умолчанию.
+        indexes (list): Составные индексы для отбора по категории
+                        с сортировкой по году или названию.
     """
     name = models.CharField(
         verbose_name='Название',
         max_length=256
     )
-    year = models.PositiveIntegerField(
+    year = models.PositiveSmallIntegerField(
         verbose_name='Год выхода произведения.',
         db_index=True,
         validators=[validate_year]
@@ -184,25 +187,55 @@ class Title(models.Model):
         Genre,
         verbose_name='Жанр',
         through='GenreTitle',
+        related_name='titles',
     )
+    # Отдельный индекс не нужен: его покрывает title_category_year_idx.
     category = models.ForeignKey(
         Category,
         verbose_name='Категория',
         on_delete=models.SET_NULL,
-        related_name='category',
-        null=True
+        related_name='titles',
+        null=True,
+        db_index=False,
+    )
+    rating = models.FloatField(
+        verbose_name='Рейтинг',
+        null=True,
+        db_index=True
+    )
+    reviews_count = models.PositiveIntegerField(
+        verbose_name='Количество отзывов',
+        default=0
     )
 
     class Meta:
-        ordering = ['name']
+        indexes = [
+            models.Index(
+                fields=['category', 'year'],
+                name='title_category_year_idx'
+            ),
+            models.Index(
+                fields=['category', 'name'],
+                name='title_category_name_idx'
+            ),
+        ]
 
-    def get_genre(self, obj):
+    @classmethod
+    def update_rating(cls, *title_ids):
         """
-        Возвращает строку с перечислением жанров для данного произведения.
-
-        Этот метод, вероятно, не используется, т.к. поле genre уже является ManyToManyField.
+        Пересчитывает rating и reviews_count произведений одним UPDATE-запросом.
         """
-        return "\n".join([g.genres for g in obj.genre.all()])
+        reviews = Review.objects.filter(
+            title_id=OuterRef('pk')
+        ).order_by().values('title_id')
+        cls.objects.filter(pk__in=title_ids).update(
+            rating=Subquery(
+                reviews.annotate(avg=Avg('score')).values('avg')
+            ),
+            reviews_count=Coalesce(
+                Subquery(reviews.annotate(cnt=Count('id')).values('cnt')), 0
+            )
+        )
 
     def __str__(self):
         """
@@ -222,23 +255,41 @@ class GenreTitle(models.Model):
     Meta:
         verbose_name (str): Отображаемое имя модели в единственном числе.
         verbose_name_plural (str): Отображаемое имя модели во множественном числе.
+        constraints (list): Один жанр привязывается к произведению только один раз.
+        indexes (list): Индекс для выборки произведений по жанру.
     """
+    # Отдельный индекс не нужен: его покрывает uniq_genre_title.
     title = models.ForeignKey(
         Title,
         verbose_name='Произведение',
         on_delete=models.CASCADE,
         null=True,
+        db_index=False,
     )
+    # Отдельный индекс не нужен: его покрывает genretitle_genre_title_idx.
     genre = models.ForeignKey(
         Genre,
         verbose_name='Жанр',
         on_delete=models.CASCADE,
         null=True,
+        db_index=False,
     )
 
     class Meta:
         verbose_name = 'Произведение и жанр'
         verbose_name_plural = 'Произведения и жанры'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['title', 'genre'],
+                name='uniq_genre_title'
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['genre', 'title'],
+                name='genretitle_genre_title_idx'
+            ),
+        ]
 
 
 class Review(models.Model):
@@ -252,28 +303,38 @@ class Review(models.Model):
         score (PositiveSmallIntegerField): Оценка произведения (от 1 до 10).
         pub_date (DateTimeField): Дата публикации отзыва.
 
+    Рейтинг произведения пересчитывается сигналами post_save/post_delete
+    (см. reviews/signals.py).
+
     Meta:
         verbose_name (str): Отображаемое имя модели в единственном числе.
         verbose_name_plural (str): Отображаемое имя модели во множественном числе.
-        ordering (list): Порядок сортировки отзывов по умолчанию.
         constraints (list): Список ограничений для модели.
             UniqueConstraint: Гарантирует уникальность комбинации title и author (один пользователь
             может оставить только один отзыв на одно произведение).
+            CheckConstraint: Оценка от 1 до 10 проверяется и на уровне БД.
+        indexes (list): Составной индекс (title, pub_date): отзывы произведения выбираются
+            уже отсортированными по дате, без отдельной сортировки.
+            Индекс (author, -pub_date): последние отзывы пользователя.
     """
+    # Отдельный индекс не нужен: его покрывает unique_review.
     title = models.ForeignKey(
         Title,
         verbose_name='Произведение',
         on_delete=models.CASCADE,
-        related_name='reviews'
+        related_name='reviews',
+        db_index=False,
     )
     text = models.TextField(
         verbose_name='Текст',
     )
+    # Отдельный индекс не нужен: его покрывает review_author_pubdate_idx.
     author = models.ForeignKey(
         User,
         verbose_name='Автор',
         on_delete=models.CASCADE,
-        related_name='reviews'
+        related_name='reviews',
+        db_index=False,
     )
     score = models.PositiveSmallIntegerField(
         verbose_name='Рейтинг',
@@ -285,18 +346,30 @@ class Review(models.Model):
     pub_date = models.DateTimeField(
         verbose_name='Дата публикации',
         auto_now_add=True,
-        db_index=True
     )
 
     class Meta:
         verbose_name = 'Отзыв'
         verbose_name_plural = 'Отзывы'
-        ordering = ['pub_date']
         constraints = [
             models.UniqueConstraint(
                 fields=['title', 'author'],
                 name='unique_review'
             ),
+            models.CheckConstraint(
+                check=Q(score__gte=1) & Q(score__lte=10),
+                name='score_range'
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['title', 'pub_date'],
+                name='review_title_pub_date_idx'
+            ),
+            models.Index(
+                fields=['author', '-pub_date'],
+                name='review_author_pubdate_idx'
+            ),
         ]
 
 from django.db import models
@@ -315,35 +388,48 @@ class Comment(models.Model):
         author (ForeignKey):  Пользователь, написавший комментарий (связь One-to-Many с User).
                               Используется `related_name='comments'` для доступа к комментариям пользователя.
         pub_date (DateTimeField): Дата и время публикации комментария.  Автоматически устанавливается при создании.
-                                 Индексируется для оптимизации запросов по дате.
 
     Meta:
         verbose_name (str): Отображаемое имя модели в единственном числе ("Комментарий").
         verbose_name_plural (str): Отображаемое имя модели во множественном числе ("Комментарии").
-        ordering (list):  Порядок сортировки комментариев по умолчанию - по дате публикации (`pub_date`).
+        indexes (list):  Составной индекс (review, pub_date): комментарии отзыва выбираются
+                         уже отсортированными по дате, без отдельной сортировки.
+                         Индекс (author, -pub_date): последние комментарии пользователя.
     """
+    # Отдельный индекс не нужен: его покрывает comment_review_pub_date_idx.
     review = models.ForeignKey(
         Review,
         verbose_name='Отзыв',
         on_delete=models.CASCADE,
-        related_name='comments'
+        related_name='comments',
+        db_index=False,
     )
     text = models.TextField(
         verbose_name='Текст',
     )
+    # Отдельный индекс не нужен: его покрывает comment_author_pubdate_idx.
     author = models.ForeignKey(
         User,
         verbose_name='Пользователь',
         on_delete=models.CASCADE,
-        related_name='comments'
+        related_name='comments',
+        db_index=False,
     )
     pub_date = models.DateTimeField(
         verbose_name='Дата публикации',
         auto_now_add=True,
-        db_index=True
     )
 
     class Meta:
         verbose_name = 'Комментарий'
         verbose_name_plural = 'Комментарии'
-        ordering = ['pub_date']
\ No newline at end of file
+        indexes = [
+            models.Index(
+                fields=['review', 'pub_date'],
+                name='comment_review_pub_date_idx'
+            ),
+            models.Index(
+                fields=['author', '-pub_date'],
+                name='comment_author_pubdate_idx'
+            ),
+        ]
\ No newline at end of file
@@ -0,0 +1,54 @@
+import threading
+import weakref
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from .models import Review, Title
+
+# Отправляется после пересчета рейтинга произведений, отложенного
+# до фиксации транзакции (аргумент title_ids).
+ratings_updated = Signal()
+
+# Слабая ссылка на множество произведений, рейтинг которых пересчитается
+# после фиксации текущей транзакции. Множество живет, пока жив
+# зарегистрированный on_commit-обработчик: при откате транзакции Django
+# отбрасывает обработчик, и следующее удаление начинает новое множество.
+_local = threading.local()
+
+
+def _flush_ratings(title_ids):
+    """
+    Пересчитывает рейтинг всех накопленных произведений одним UPDATE-запросом.
+    """
+    _local.pending = None
+    Title.update_rating(*title_ids)
+    ratings_updated.send(sender=Title, title_ids=title_ids)
+
+
+@receiver(post_save, sender=Review)
+def update_title_rating(sender, instance, **kwargs):
+    """
+    Пересчитывает рейтинг произведения после создания или изменения отзыва.
+    """
+    Title.update_rating(instance.title_id)
+
+
+@receiver(post_delete, sender=Review)
+def update_title_rating_on_delete(sender, instance, **kwargs):
+    """
+    Откладывает пересчет рейтинга произведения до фиксации транзакции.
+
+    Каскадное удаление произведения или пользователя удаляет отзывы
+    в одной транзакции, поэтому рейтинг пересчитывается один раз
+    для всех затронутых произведений.
+    """
+    pending = getattr(_local, 'pending', None)
+    title_ids = pending() if pending is not None else None
+    if title_ids is not None:
+        title_ids.add(instance.title_id)
+        return
+    title_ids = {instance.title_id}
+    _local.pending = weakref.ref(title_ids)
+    transaction.on_commit(lambda: _flush_ratings(title_ids))
@@ -0,0 +1,66 @@
+from django.db import connection, transaction
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from .models import Category, Review, Title, User
+
+
+def title_updates(queries):
+    return [query['sql'] for query in queries.captured_queries
+            if query['sql'].startswith('UPDATE "reviews_title"')]
+
+
+class RatingCascadeTests(TransactionTestCase):
+
+    def setUp(self):
+        category = Category.objects.create(name='Фильм', slug='movie')
+        self.titles = [
+            Title.objects.create(name=f'Фильм {i}', year=2000,
+                                 category=category)
+            for i in range(2)
+        ]
+        self.users = [
+            User.objects.create(username=f'user{i}',
+                                email=f'user{i}@yamdb.fake')
+            for i in range(3)
+        ]
+        for title in self.titles:
+            for score, user in zip((2, 6, 10), self.users):
+                Review.objects.create(title=title, author=user,
+                                      text='Отзыв', score=score)
+
+    def test_title_delete_recomputes_rating_once(self):
+        """Удаление произведения не пересчитывает рейтинг по каждому отзыву."""
+        with CaptureQueriesContext(connection) as queries:
+            self.titles[0].delete()
+        self.assertLessEqual(len(title_updates(queries)), 1)
+        self.assertFalse(Review.objects.filter(title=self.titles[0]).exists())
+
+    def test_user_delete_recomputes_rating_once(self):
+        """Удаление пользователя пересчитывает рейтинг одним запросом."""
+        with CaptureQueriesContext(connection) as queries:
+            self.users[2].delete()
+        self.assertEqual(len(title_updates(queries)), 1)
+        for title in self.titles:
+            title.refresh_from_db()
+            self.assertEqual(title.rating, 4)
+            self.assertEqual(title.reviews_count, 2)
+
+    def test_review_delete_recomputes_rating(self):
+        Review.objects.get(title=self.titles[0], author=self.users[0]).delete()
+        self.titles[0].refresh_from_db()
+        self.assertEqual(self.titles[0].rating, 8)
+        self.assertEqual(self.titles[0].reviews_count, 2)
+
+    def test_rolled_back_delete_does_not_block_recompute(self):
+        """После отката транзакции рейтинг снова пересчитывается."""
+        review = Review.objects.get(title=self.titles[0], author=self.users[0])
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                review.delete()
+                raise RuntimeError
+        Review.objects.get(title=self.titles[1], author=self.users[0]).delete()
+        self.titles[1].refresh_from_db()
+        self.assertEqual(self.titles[1].rating, 8)
+        self.titles[0].refresh_from_db()
+        self.assertEqual(self.titles[0].reviews_count, 3)
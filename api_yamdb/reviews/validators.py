@@ -1,9 +1,30 @@
+import time
+
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 
+# текущий год и момент (timestamp), когда он сменится следующим
+_current_year = None
+_next_year_starts_at = 0.0
+
+
+def get_current_year():
+    """
+    Возвращает текущий год, вычисляя его заново только после смены года.
+    """
+    global _current_year, _next_year_starts_at
+    if time.time() >= _next_year_starts_at:
+        now = timezone.now()
+        _current_year = now.year
+        _next_year_starts_at = now.replace(
+            year=now.year + 1, month=1, day=1,
+            hour=0, minute=0, second=0, microsecond=0
+        ).timestamp()
+    return _current_year
+
 
 def validate_year(value):
-    if value > timezone.now().year:
+    if value > get_current_year():
         raise ValidationError(
             ('Год %(value)s больше текущего!'),
             params={'value': value},